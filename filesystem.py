@@ -1,21 +1,32 @@
 from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Callable, Any
+from typing import Callable, Iterable, Any
 from shutil import rmtree
 from enum import Enum
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+from watchdog.observers.api import ObservedWatch
 from watchdog.events import FileSystemEventHandler
 
 import os
 import sys
+import stat
+import atexit
 import ctypes
 import json
+import hashlib
 import time
 import datetime
 import threading
+import contextlib
 # import numpy as np
 
+try:
+    import orjson  # (optional; faster JSON (de)serialisation)
+except ImportError:
+    orjson = None
+
 
 # special classes:
 class options:
@@ -23,64 +34,260 @@ class options:
         windows = sys.platform.startswith("win")
         linux = not windows
     class json:
-        indent = 4
+        indent = 4  # (`orjson` only supports 2 or None; at other values, including this default, the slower stdlib `json` is used)
+        flush_delay = 0.05  # (s; coalesces `JSON.update()` writes)
     class defaults:
         timeout = 4000 # (ms)
+    class folder:
+        attr_lookup = True  # (allow `folder.name` as shorthand for `folder['name']`)
+    class watch:
+        interval_s = 60  # (polling interval for network mounts)
+        force_polling = False  # (poll even on local file systems)
+        network_fs_types = ("cifs", "smb3", "smbfs", "nfs", "nfs4")
 
 
 class runtime_properties:
-    root: Folder = None
-    created_instances: list[SysObj] = []
+    root: Folder = None  # (constructed on first use; see `get_root()`)
+    root_key: tuple[int, int] = None  # (st_dev, st_ino) of root; see `get_root_key()`
+    created_instances: set[str] = set()  # (paths of objects created in Python)
+    created_count: int = 0
+    observer: Observer = None  # (shared by all `Folder` listeners; see `get_observer()`)
+    polling_observer: PollingObserver = None  # (shared by listeners on network mounts)
+    network_devices: set[int] = None  # (`st_dev` of network file systems; linux only)
+    drive_types: dict[str, int] = {}  # (windows only)
+    watches: dict[tuple[bool, str], SharedWatch] = {}  # (keyed by (polling, path); see `watch_path()`)
+    watch_lock = threading.Lock()
+
+
+@dataclass
+class SharedWatch:
+    watch: ObservedWatch
+    handlers: set[FileSystemEventHandler]
+
+
+_NOT_STATTED = object()  # (sentinel; `SysObj.__init__` stats the path itself)
+
+
+# platform bindings:
+FILE_ATTRIBUTE_HIDDEN = 0x02
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+DRIVE_REMOTE = 4
+
+if options.platform.windows:  # (resolve kernel32 functions once rather than per call)
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+
+    _SetFileAttributesW = ctypes.windll.kernel32.SetFileAttributesW
+    _SetFileAttributesW.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32]
+    _SetFileAttributesW.restype = ctypes.c_int
+
+    _GetDriveTypeW = ctypes.windll.kernel32.GetDriveTypeW
+    _GetDriveTypeW.argtypes = [ctypes.c_wchar_p]
+    _GetDriveTypeW.restype = ctypes.c_uint32
 
 
 # static functions:
 def get_datetime():
     return datetime.datetime.now().strftime('%d/%m/%Y, %H:%M:%S')
 
+def use_orjson() -> bool:
+    """
+    Whether `orjson` is used for both reading and writing. The two codecs disagree on some values (NaN, integers beyond 64 bits), so the codec that writes a file must also read it.
+    """
+    return orjson is not None and options.json.indent in (None, 2)
+
+def json_dumps(data) -> bytes:
+    """
+    Serialise `data` to UTF-8 JSON.
+    """
+    if use_orjson():
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if options.json.indent else 0)
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(data, indent=options.json.indent).encode()
+
+def json_loads(buf: bytes):
+    return orjson.loads(buf) if use_orjson() else json.loads(buf)
+
 def get_win_file_attrs(path: str):
     """
     Convenience method for retrieving WindowsOS file attributes.
     """
-    attrs = ctypes.windll.kernel32.GetFileAttributesW(path)
-    if attrs == -1:
+    attrs = _GetFileAttributesW(os.fspath(path))
+    if attrs == INVALID_FILE_ATTRIBUTES:
         raise FileNotFoundError()
     
     return attrs
 
-def assign_type(path: Path):
+def get_network_devices() -> set[int]:
+    """
+    Returns the device numbers (`st_dev`) of network file systems, read once from `/proc/self/mountinfo`.
+    """
+    if runtime_properties.network_devices is None:
+        devices = set()
+        try:
+            with open("/proc/self/mountinfo", 'r') as file:
+                for line in file:
+                    fields, _, fs_fields = line.partition(" - ")
+                    if fs_fields.split(" ", 1)[0] in options.watch.network_fs_types:
+                        major, minor = fields.split(" ")[2].split(":")
+                        devices.add(os.makedev(int(major), int(minor)))
+        except OSError:
+            pass  # (no procfs, e.g. macOS)
+
+        runtime_properties.network_devices = devices
+
+    return runtime_properties.network_devices
+
+def is_network_path(path: str | Path, st: os.stat_result | None=None) -> bool:
+    """
+    Checks whether `path` lives on a network drive or mount (SMB, NFS).
+
+    Args:
+        st (os.stat_result, optional): Result of `os.stat(path)`, if already known; avoids another stat.
+    """
+    if options.platform.windows:
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        if drive not in runtime_properties.drive_types:
+            runtime_properties.drive_types[drive] = _GetDriveTypeW(drive + "\\")
+        return runtime_properties.drive_types[drive] == DRIVE_REMOTE
+    else:
+        devices = get_network_devices()
+        if not devices:
+            return False  # (common case; no syscalls)
+
+        return (st or os.stat(path)).st_dev in devices
+
+def get_root_key() -> tuple[int, int]:
+    """
+    Returns `(st_dev, st_ino)` of the root (working directory), stat'd once on first use.
+    """
+    if runtime_properties.root_key is None:
+        st = os.stat('.')
+        runtime_properties.root_key = (st.st_dev, st.st_ino)
+
+    return runtime_properties.root_key
+
+def get_root() -> Folder:
+    """
+    Returns the root `Folder`, constructing it on first use rather than at import.
+    """
+    if runtime_properties.root is None:
+        runtime_properties.root = Folder('.', mode=FileMode.FIND)
+
+    return runtime_properties.root
+
+def get_observer(polling=False) -> Observer | PollingObserver:
+    """
+    Returns the shared watchdog observer, starting it on first use.
+
+    Args:
+        polling (bool): Return the `PollingObserver` used for network mounts, which do not reliably report native events.
+    """
+    attr = "polling_observer" if polling else "observer"
+    if getattr(runtime_properties, attr) is None:
+        if polling:
+            observer = PollingObserver(timeout=options.watch.interval_s)
+        else:
+            observer = Observer()
+        observer.start()
+        atexit.register(observer.stop)
+        setattr(runtime_properties, attr, observer)
+
+    return getattr(runtime_properties, attr)
+
+def watch_path(handler: FileSystemEventHandler, path: str, polling=False, replace=False):
+    """
+    Schedules `handler` for `path` on the shared observer.
+
+    Args:
+        replace (bool): Discard any existing watch on `path`; set when the directory was just created.
+
+    Notes:
+        watchdog keeps one watch per path, and keeps it registered (with a dead emitter) after the directory is removed. An existing watch is therefore only reused while its emitter is alive.
+    """
+    observer = get_observer(polling)
+    with runtime_properties.watch_lock:
+        shared = runtime_properties.watches.get((polling, path))
+        if shared is not None:
+            if replace or not is_watch_alive(shared, polling):
+                try:
+                    observer.unschedule(shared.watch)  # (stale; directory was removed or replaced)
+                except KeyError:
+                    pass
+                shared = None
+
+        watch = observer.schedule(handler, path, recursive=False)
+        if shared is None:
+            shared = runtime_properties.watches[(polling, path)] = SharedWatch(watch, set())
+        shared.handlers.add(handler)
+
+def is_watch_alive(shared: SharedWatch, polling=False) -> bool:
+    emitter = get_observer(polling)._emitter_for_watch.get(shared.watch)  # (watchdog has no public lookup by watch)
+    return emitter is not None and emitter.is_alive()
+
+def is_watching(handler: FileSystemEventHandler, path: str, polling=False) -> bool:
+    """
+    Checks whether `handler` is still scheduled for `path` on a live watch.
+    """
+    shared = runtime_properties.watches.get((polling, path))
+    return shared is not None and handler in shared.handlers and is_watch_alive(shared, polling)
+
+def unwatch_path(handler: FileSystemEventHandler, path: str, polling=False):
+    """
+    Removes `handler` scheduled by `watch_path()`, unscheduling the watch once it has no handlers left.
+    """
+    observer = get_observer(polling)
+    with runtime_properties.watch_lock:
+        shared = runtime_properties.watches.get((polling, path))
+        if shared is None or handler not in shared.handlers:
+            return  # (watch was already replaced or removed)
+
+        shared.handlers.remove(handler)
+        try:
+            if shared.handlers:
+                observer.remove_handler_for_watch(handler, shared.watch)
+            else:
+                del runtime_properties.watches[(polling, path)]
+                observer.unschedule(shared.watch)
+        except KeyError:
+            pass
+
+def assign_type(path: Path | os.DirEntry):
+    if isinstance(path, os.DirEntry):
+        cls = Folder if path.is_dir() else File
+        return cls._from_direntry(path)
+
     if path.is_dir():
         return Folder(path)
     else:
         return File(path)
     
-def delete_path(path: Path):
-    if path.is_dir():
-        rmtree(path.absolute())
+def delete_path(path: str | Path):
+    if os.path.isdir(path):
+        rmtree(path)
     else:
-        os.remove(path.absolute())
+        os.remove(path)
 
 def ensure_path(path: str | Path | SysObj) -> Path:
-    path_obj = None
-
-    match path:
-        case str():
-            path_obj = Path(path)
-        case SysObj():
-            path_obj = path.path
-
+    if type(path) is str:  # (most common; checked first)
+        return Path(path)
     if isinstance(path, Path):
-        path_obj = path
+        return path
+    if isinstance(path, SysObj):
+        return path.path
 
-    return path_obj
+    return Path(path)  # (other `os.PathLike`)
 
 def parse_path(parent, path) -> Path:
-    path = ensure_path(path)
+    path = path if isinstance(path, Path) else ensure_path(path)  # (inline fast path)
     if parent is None:
         return path
     else:
         assert len(path.parts) == 1, "When using parent-child pathing, child length must be one."
-        parent = ensure_path(parent)
-        return Path(os.path.join(str(parent), str(path)))
+        parent = parent if isinstance(parent, Path) else ensure_path(parent)
+        return parent / path
 
 
 # main classes:
@@ -94,7 +301,9 @@ class FileMode(Enum):
 
 class SysObj:
 
-    def __init__(self, path: str | Path, *, mode=FileMode.UPDATE, parent: str | Path | SysObj | None=None):
+    __slots__ = ('_path', '_path_obj', '_name', '_stat', '_was_detected', '_is_dir', '_parent', '_protected', '_is_root')  # (no per-instance `__dict__`)
+
+    def __init__(self, path: str | Path, *, mode=FileMode.UPDATE, parent: str | Path | SysObj | None=None, _stat: os.stat_result | None=_NOT_STATTED):
         """
         Base class for system objects. 
 
@@ -108,46 +317,105 @@ class SysObj:
             assert ensure_path(parent).is_dir(), "Parent must be a directory."
 
         path = parse_path(parent, path)
-        self._path = path
-        self._name: str = self._path.name
+        self._path: str = os.fspath(path)  # (string form used for I/O; see `path`)
+        self._path_obj: Path = path
+        self._name: str = path.name
+
+        if _stat is _NOT_STATTED:
+            try:
+                _stat = os.stat(self._path)  # (single stat; reused by validators and root check)
+            except (FileNotFoundError, NotADirectoryError):
+                _stat = None
 
-        self._was_detected = self._path.exists()
-        self._is_dir: bool = self._path.is_dir()
+        self._stat: os.stat_result = _stat  # (None if missing or created by this object)
 
-        if runtime_properties.root is None:
-            runtime_properties.root = self
+        self._was_detected = self._stat is not None
+        self._is_dir: bool = self._was_detected and stat.S_ISDIR(self._stat.st_mode)
 
         self._parent: SysObj = None
 
         self._protected = False
-        self.__create__ = self._setup_wrapper(self.__create__)
 
         self.__params__()  # (initialise custom parameters)
         self.__validate__()  # (validate before making real changes to OS file system)
 
-        match mode:
-            case FileMode.FIND:
-                if not self._was_detected:
-                    raise FileNotFoundError()
-                
-            case FileMode.CREATE:
-                if self._was_detected:
-                    raise FileExistsError()
-                self.__create__()
-                
-            case FileMode.UPDATE:
-                if not self._was_detected:
-                    self.__create__()
-
-            case FileMode.OVERWRITE:
-                if self._was_detected:
-                    self.rm()
-                self.__create__()
+        created = self._open_modes[mode](self)  # (table dispatch; cheaper than `match` per construction)
 
-        self._is_root = os.path.samefile(self.path, runtime_properties.root.path)  # (requires path to reference real object)
+        if created:
+            self._stat = None  # (stale or missing; not needed again)
+            self._is_root = False  # (root already existed, so cannot be a newly created object)
+        else:
+            self._is_root = (self._stat.st_dev, self._stat.st_ino) == get_root_key()
         self._parent = None
         self.__configure__()
 
+    @classmethod
+    def _from_direntry(cls, entry: os.DirEntry) -> SysObj:
+        """
+        Construct from an `os.scandir` entry, as if opened with `mode=FileMode.FIND`. Skips the path parsing and existence checks of `__init__`.
+        """
+        self = cls.__new__(cls)
+        self._path: str = entry.path
+        self._path_obj: Path = None  # (built on first `path` access)
+        self._name: str = entry.name
+
+        self._stat = entry.stat()  # (cached by `DirEntry`; raises `FileNotFoundError` if entry has since vanished)
+        self._was_detected = True
+        self._is_dir: bool = stat.S_ISDIR(self._stat.st_mode)
+
+        self._parent: SysObj = None
+
+        self._protected = False
+
+        self.__params__()
+        self.__validate__()
+
+        self._is_root = (self._stat.st_dev, self._stat.st_ino) == get_root_key()
+        self.__configure__()
+        return self
+
+    def _open_find(self) -> bool:
+        if not self._was_detected:
+            raise FileNotFoundError()
+        return False
+
+    def _open_create(self) -> bool:
+        if self._was_detected:
+            raise FileExistsError()
+        self.__create__(exclusive=True)  # (pre-check above may be stale)
+        self._after_create()
+        return True
+
+    def _open_update(self) -> bool:
+        if self._was_detected:
+            return False
+        self.__create__()
+        self._after_create()
+        return True
+
+    def _open_overwrite(self) -> bool:
+        if self._was_detected:
+            self.rm()
+        self.__create__()
+        self._after_create()
+        return True
+
+    _open_modes: dict[FileMode, Callable[[SysObj], bool]] = {  # (returns whether the object was (re)created)
+        FileMode.FIND: _open_find,
+        FileMode.CREATE: _open_create,
+        FileMode.UPDATE: _open_update,
+        FileMode.OVERWRITE: _open_overwrite,
+    }
+
+    def _is_entry(self, entry: os.DirEntry) -> bool:
+        """
+        Checks whether `entry` (from a re-listing of the parent) still refers to this object, so it can be reused.
+        """
+        try:
+            return self._stat is not None and entry.is_dir() == self._is_dir and entry.inode() == self._stat.st_ino
+        except OSError:
+            return False
+
     def __params__(self):
         """
         Initialise parameters.
@@ -160,9 +428,12 @@ class SysObj:
         """
         pass
 
-    def __create__(self):
+    def __create__(self, exclusive=False):
         """
         Mandatory object creation method.
+
+        Args:
+            exclusive (bool): Raise `FileExistsError` if the object already exists (`FileMode.CREATE`).
         """
         raise NotImplementedError()
     
@@ -178,7 +449,10 @@ class SysObj:
 
     @property
     def path(self) -> Path:
-        return self._path
+        if self._path_obj is None:
+            self._path_obj = Path(self._path)
+
+        return self._path_obj
     
     @property
     def dirpath(self) -> Path:
@@ -202,12 +476,12 @@ class SysObj:
     def ishidden(self) -> bool:
         return self._ishidden()
 
-    def _setup_wrapper(self, create_method: Callable):
-        def wrapped_create_method():
-            runtime_properties.created_instances.append(self.path)
-            return create_method()
-
-        return wrapped_create_method
+    def _after_create(self):
+        """
+        Called after each `__create__()`; records the new object.
+        """
+        runtime_properties.created_instances.add(self._path)
+        runtime_properties.created_count += 1
 
     def rm(self):
         """
@@ -216,16 +490,16 @@ class SysObj:
         if self._protected:
             raise PermissionError()
 
-        delete_path(self.path)
+        delete_path(self._path)
 
     def _ishidden(self) -> bool:
         """
         Checks platform-specific parameters to determine whether the `SysObj` is hidden.
         """
         if options.platform.windows:
-            attrs = get_win_file_attrs(self.path)
+            attrs = get_win_file_attrs(self._path)
 
-            return bool(attrs & 0x02)
+            return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
         else:
             return self.name.startswith('.')
 
@@ -244,43 +518,56 @@ class SysObj:
         
         if options.platform.windows:
             if hide:
-                ctypes.windll.kernel32.SetFileAttributesW(self.path, 0x02)
+                _SetFileAttributesW(self._path, FILE_ATTRIBUTE_HIDDEN)
             else:
-                attrs = get_win_file_attrs(self.path)
-                ctypes.windll.kernel32.SetFileAttributesW(self.path, attrs & ~0x02)
+                attrs = get_win_file_attrs(self._path)
+                _SetFileAttributesW(self._path, attrs & ~FILE_ATTRIBUTE_HIDDEN)
         else:
             if hide:
                 new_path_str = os.path.join(self.dirpath, '.' + self.name)
             else:
                 new_path_str = os.path.join(self.dirpath, self.name[1:])
 
-            os.rename(self.path, new_path_str)
+            os.rename(self._path, new_path_str)
             self.__init__(new_path_str, mode=FileMode.FIND)
         
 
 class Folder(SysObj):
 
+    __slots__ = ('_handler', '_polling', '_indexed', '_directory', '_neg_cache')
+
+    def __params__(self):
+        if getattr(self, '_handler', None) is not None:
+            self._deactivate_listener()  # (re-initialised in place, e.g. by `hide()`)
+
+        self._handler: FileSystemEventHandler = None  # (set once the listener is active)
+        self._polling = False  # (whether `_handler` is on the polling observer)
+
     def __validate__(self):
         if self._was_detected:
             assert self._is_dir, "Path does not lead to a `folder`."
 
-    def __create__(self):
-        os.mkdir(self.path)
+    def __create__(self, exclusive=False):
+        os.mkdir(self._path)  # (always exclusive)
 
     def __configure__(self):
         self._indexed = False  # (true when searched at least once; prevents unnecessary indexing of children)
         self._directory = {}
+        self._neg_cache: set[str] = set()  # (names known to be missing since last index)
         self._activate_listener(
-            on_created_event=self._update_dir,
-            on_deleted_event=self._update_dir
+            on_created_event=self._mark_dirty,
+            on_deleted_event=self._mark_dirty
         )
 
     def __getattr__(self, target) -> SysObj:
         """
-        Prioritises instance attributes, then accesses directory.
+        Called only when normal attribute lookup fails; falls back to the directory.
+
+        Notes:
+            Names starting with `_` are never looked up in the directory, so that private attributes and framework probes (`__deepcopy__`, `_repr_html_`, ...) do not index it; use `folder['_name']` instead. Set `options.folder.attr_lookup = False` to disable directory lookup entirely.
         """
-        if target in self.__dict__.keys():
-            return self.__dict__.get(target)
+        if target.startswith('_') or not options.folder.attr_lookup:
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, target))
         else:
             return self._search_dir(target)
 
@@ -294,6 +581,7 @@ class Folder(SysObj):
     def directory(self) -> dict[str, SysObj]:
         if self._indexed == False:
             self._indexed = True
+            self._neg_cache.clear()  # (misses recorded before a concurrent `_mark_dirty()` are stale)
             self._update_dir()
         
         return self._directory
@@ -303,30 +591,65 @@ class Folder(SysObj):
         return list(self.directory.values())
     
     def _search_dir(self, target: str) -> SysObj:
-        if target in self.directory.keys():
-            return self.directory.get(target)
-        else:
-            print("'%s' does not exist in '%s'" % (target, self.path))
+        if self._indexed and target in self._neg_cache:
+            return None  # (already reported missing)
+
+        obj = self.directory.get(target)
+        if obj is None:
+            if self._indexed:  # (only cache misses against a still-valid index)
+                self._neg_cache.add(target)
+            print("'%s' does not exist in '%s'" % (target, self._path))
+
+        return obj
+
+    def _mark_dirty(self):
+        """
+        Invalidate the index; the directory is re-listed on next access.
+        """
+        self._indexed = False
+        self._neg_cache.clear()
 
     def _update_dir(self):
-        contents = os.listdir(self.path)
-       
-        self._directory = {filename: assign_type(Path(os.path.join(self.path, filename))) for filename in contents}
+        old_directory = self._directory
+        directory = {}
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                child = old_directory.get(entry.name)
+                if child is not None and child._is_entry(entry):
+                    directory[entry.name] = child  # (unchanged; keeps its listener and index)
+                    continue
+
+                try:
+                    directory[entry.name] = assign_type(entry)
+                except FileNotFoundError:
+                    pass  # (removed since listing, or dangling symlink)
+
+        self._directory = directory
+
+        for name, child in old_directory.items():
+            if isinstance(child, Folder) and directory.get(name) is not child:
+                child._deactivate_listener()  # (dropped; otherwise the observer keeps it alive)
 
     def _activate_listener(self, on_created_event: callable, on_deleted_event: callable):
         """
         """
         class FolderEventHandler(FileSystemEventHandler):
 
-            def direct(self, event):
-                event_path = os.path.abspath(event.src_path)
-                parent_path = os.path.dirname(event_path)
+            def direct(self, event, path=None):
+                parent_path = os.path.dirname(path or event.src_path)
+                if parent_path == self.watched_path:
+                    return True  # (fast path; inotify, polling and windows emitters join onto the scheduled path)
 
-                return os.path.samefile(parent_path, self.folder.path)
+                if self.real_path is None:
+                    self.real_path = os.path.realpath(self.watched_path)  # (resolved once; FSEvents reports absolute real paths)
+
+                return parent_path == self.real_path
 
             def __init__(self, folder: Folder):
                 super().__init__()
                 self.folder = folder
+                self.watched_path = folder._path
+                self.real_path: str = None
 
             def on_created(self, event):
                 if self.direct(event):
@@ -338,36 +661,89 @@ class Folder(SysObj):
                     # print("'%s' deleted." % event.src_path)
                     on_deleted_event()
 
+            def on_moved(self, event):
+                if self.direct(event) or self.direct(event, event.dest_path):
+                    on_created_event()  # (a rename changes the listing like a create/delete pair)
+
             def on_modified(self, event):
                 if self.direct(event):
                     # print("'%s' modified." % event.src_path)
                     ...
                 
         handler = FolderEventHandler(self)
-        observer = Observer()
-        observer.schedule(handler, self.path, recursive=False)
-        observer.start()
+        self._polling = options.watch.force_polling or is_network_path(self._path, self._stat)
+        watch_path(handler, handler.watched_path, self._polling, replace=self._stat is None)  # (`_stat` is None if this object created the folder)
+        self._handler = handler
+
+    def _deactivate_listener(self):
+        if self._handler is None:
+            return
+
+        unwatch_path(self._handler, self._handler.watched_path, self._polling)
+        self._handler = None
+
+        for child in self._directory.values():
+            if isinstance(child, Folder):
+                child._deactivate_listener()
+
+    def _is_entry(self, entry: os.DirEntry) -> bool:
+        return super()._is_entry(entry) and self._handler is not None and is_watching(self._handler, self._handler.watched_path, self._polling)
+
+    def rm(self):
+        if not self._protected:
+            self._deactivate_listener()
+
+        super().rm()
 
     def mkdir(self, target, **kwargs) -> Folder:
         """
         Create new <Folder> object in hierarchy. **MUST NOT CREATE SUBDIRECTORIES** (now enforced by SysObj.__init__)
         """
-        f = Folder(target, parent=self.path, **kwargs)
+        f = Folder(target, parent=self._path, **kwargs)
+        self._mark_dirty()
         return f
 
     def mk(self, target, **kwargs) -> File:
         """
         Create new <File> object in hierarchy. **MUST NOT CREATE SUBDIRECTORIES** (now enforced by SysObj.__init__)
         """
-        f = File(target, parent=self.path, **kwargs)
+        f = File(target, parent=self._path, **kwargs)
+        self._mark_dirty()
         return f
+
+    def mk_many(self, targets: Iterable[str], cls: type[SysObj] | None=None, **kwargs) -> list[SysObj]:
+        """
+        Create several objects in hierarchy. Existence is checked with a single directory scan rather than per object.
+
+        Args:
+            targets (Iterable[str]): Names of the new objects.
+            cls (type[SysObj]): Type of the new objects. Defaults to `File`.
+        """
+        cls = cls or File
+        with os.scandir(self._path) as entries:
+            existing = {entry.name: entry for entry in entries}
+
+        objs = []
+        try:
+            for target in targets:
+                entry = existing.get(target)
+                try:
+                    st = entry.stat() if entry else None
+                except FileNotFoundError:
+                    st = None  # (removed since listing, or dangling symlink)
+
+                objs.append(cls(self.join(target), _stat=st, **kwargs))
+        finally:
+            self._mark_dirty()  # (also covers objects created before a failure)
+
+        return objs
     
     def join(self, target):
         """
         Append target to `self.path` and return the new path.
         """
         assert len(ensure_path(target).parts) == 1, "target must be a name, not a path."
-        return os.path.join(self.path, target)
+        return os.path.join(self._path, target)
     
     def get(self, target, timeout=options.defaults.timeout) -> SysObj:
         """
@@ -394,18 +770,19 @@ class Folder(SysObj):
             def on_created(self, *_):
                 event.set()
 
-        observer = Observer()
-        observer.schedule(TempHandler(), path=self.path)
-        observer.start()
+        handler = TempHandler()
+        polling = options.watch.force_polling or is_network_path(self._path, self._stat)
+        watch_path(handler, self._path, polling)
 
         event.wait(timeout=timeout)
 
-        observer.stop()
-        observer.join()
+        unwatch_path(handler, self._path, polling)
 
 
 class File(SysObj):
 
+    __slots__ = ('_ext',)
+
     def __params__(self):
         _, self._ext = os.path.splitext(self.name)
 
@@ -417,8 +794,10 @@ class File(SysObj):
         if self._was_detected:
             assert not self._is_dir, "Path does not lead to a `file`."
 
-    def __create__(self):
-        open(self.path, 'w').close()
+    def __create__(self, exclusive=False):
+        flags = os.O_CREAT | os.O_WRONLY | (os.O_EXCL if exclusive else 0)  # (never truncates if another process created it first)
+        fd = os.open(self._path, flags, 0o666)
+        os.close(fd)
 
     @property
     def ext(self):
@@ -428,35 +807,153 @@ class File(SysObj):
         """
         Passthrough method to write to file.
         """
-        with open(self.path, mode=mode) as file:
+        with open(self._path, mode=mode) as file:
             file.write(data)
 
     def read(self) -> str:
         """
         Passthrough method to read from file.
         """
-        with open(self.path, 'r') as file:
+        with open(self._path, 'r') as file:
             return file.read()
         
 
 class JSON(File):
 
+    __slots__ = ('_last_hash', '_last_key', '_cache', '_flush_timer', '_flush_error', '_lock')
+
+    def __params__(self):
+        super().__params__()
+        if getattr(self, '_flush_timer', None) is not None:
+            self.flush()  # (re-initialised in place with updates pending)
+
+        self._last_hash: bytes = None  # (digest of the contents last written or read)
+        self._last_key: tuple[int, int] = None  # (st_mtime_ns, st_size) when `_last_hash` was taken
+        self._cache: bytes = None  # (encoded contents; newer than the file while a flush is pending)
+        self._flush_timer: threading.Timer = None
+        self._flush_error: Exception = None  # (raised by a failed background flush; re-raised by `flush()`/`update()`)
+        self._lock = threading.RLock()
+
     def __validate__(self):
         super().__validate__()
         assert self.ext.endswith('.json'), "JSON file must end with '.json'"
 
+    def _remember(self, buf: bytes, st: os.stat_result):
+        self._last_hash = hashlib.blake2b(buf, digest_size=16).digest()
+        self._last_key = (st.st_mtime_ns, st.st_size)
+
+    def _is_current(self) -> bool:
+        """
+        Checks whether the file is unmodified since it was last written or read by this object.
+        """
+        if self._last_key is None:
+            return False
+
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return False
+
+        return (st.st_mtime_ns, st.st_size) == self._last_key
+
+    def _write(self, buf: bytes):
+        if self._is_current() and hashlib.blake2b(buf, digest_size=16).digest() == self._last_hash:
+            return  # (nothing to write)
+
+        tmp_path = self._path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(buf)  # (single write of the whole document)
+                file.flush()
+                st = os.fstat(file.fileno())
+
+            os.replace(tmp_path, self._path)  # (atomic; readers never see a partial file)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)  # (leaves nothing behind; fails harmlessly if the temp path is not ours)
+            raise
+
+        self._remember(buf, st)
+
+    def _cancel_flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
     def write(self, data: dict):
-        with open(self.path, 'w') as file:
-            json.dump(data, file, indent=options.json.indent)            
+        buf = json_dumps(data)
+        with self._lock:
+            self._cancel_flush()
+            self._flush_error = None  # (superseded by this write)
+            try:
+                self._write(buf)
+            except BaseException:
+                self._cache = None  # (re-read from disk rather than report contents that were never written)
+                raise
+            self._cache = buf
 
     def read(self) -> dict:
-        with open(self.path, 'r') as file:
-            return json.load(file)
+        """
+        Returns the parsed contents. The encoded contents are cached, so the file is only re-read if it was modified elsewhere; each call returns a new `dict`.
+        """
+        with self._lock:
+            if self._cache is None or (self._flush_timer is None and not self._is_current()):
+                with open(self._path, 'rb') as file:
+                    self._cache = file.read()
+                    self._remember(self._cache, os.fstat(file.fileno()))
+
+            return json_loads(self._cache)
 
     def update(self, data: dict):
-        old_data = self.read()
-        old_data.update(data)
-        self.write(old_data)
+        """
+        Merge `data` into the contents. The write is deferred by `options.json.flush_delay` so that bursts of updates are written once.
+        """
+        with self._lock:
+            self._raise_flush_error()
+            contents = self.read()
+            contents.update(data)
+            self._cache = json_dumps(contents)  # (encode here, so errors are raised to the caller rather than in the timer thread)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(options.json.flush_delay, self._background_flush)
+                self._flush_timer.start()
+
+    def flush(self):
+        """
+        Write pending `update()` changes immediately. Raises the error of a failed background flush, if any.
+        """
+        with self._lock:
+            self._raise_flush_error()
+            if self._flush_timer is None:
+                return
+
+            self._cancel_flush()
+            try:
+                self._write(self._cache)
+            except BaseException:
+                self._cache = None  # (pending changes are lost; re-read from disk)
+                raise
+
+    def _background_flush(self):
+        try:
+            self.flush()
+        except Exception as e:
+            self._flush_error = e  # (no caller on the timer thread; surfaced by the next `flush()`/`update()`)
+
+    def _raise_flush_error(self):
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    def hide(self, hide=True, /):
+        with self._lock:
+            self.flush()  # (write pending updates before the file is renamed and re-initialised)
+            super().hide(hide)
+
+    def rm(self):
+        with self._lock:
+            self._cancel_flush()
+            super().rm()
+            self._cache = None
         
 
 # class NPY(File):
@@ -474,10 +971,6 @@ class JSON(File):
 #             return np.load(file)
 
 
-runtime_properties.root = Folder('.', mode=FileMode.FIND)
-    
-
-
 if __name__ == "__main__":
 
     arg = Folder("arg", mode=FileMode.OVERWRITE)
@@ -493,5 +986,5 @@ if __name__ == "__main__":
     # file.rm()
     # print(implicit.directory)
 
-    print('number of instances created: %s' % len(runtime_properties.created_instances))
+    print('number of instances created: %s' % runtime_properties.created_count)
 